@@ -9,6 +9,64 @@ from collections.abc import Hashable
 from copy import deepcopy
 
 
+# attribute values that can be shared between copies of the attributes.
+_IMMUTABLE = (str, bytes, int, float, complex, bool, type(None))
+
+
+def _copy_attributes(attributes):
+    """Copies an attribute dictionary.
+
+    Spectra attributes are flat key-value pairs, possibly with one level of
+    nested dictionaries (e.g. "Run Mode Information"). These are copied
+    directly; anything else falls back on `copy.deepcopy`.
+
+    Args:
+        attributes (dict): Attributes to be copied.
+
+    Returns:
+        dict:
+            Copy of `attributes` that shares no mutable values with it.
+    """
+    rval = dict()
+    for k, v in attributes.items():
+        if isinstance(v, _IMMUTABLE):
+            rval[k] = v
+        elif (isinstance(v, dict) and
+              all(isinstance(x, _IMMUTABLE) for x in v.values())):
+            rval[k] = dict(v)
+        else:
+            return deepcopy(attributes)
+    return rval
+
+
+def _contract(data, weights, axis):
+    """Contracts `weights` against `data` along `axis`.
+
+    The contraction is ordered so that contiguous data are never copied:
+    Fortran-ordered data are contracted through their (C-ordered) transpose,
+    and the last two axes are contracted with `numpy.matmul`, which works on
+    the data in place.
+
+    Args:
+        data (numpy.ndarray): Data to be contracted.
+        weights (numpy.ndarray): 1D weights, one per entry along `axis`.
+        axis (int): Axis of `data` along which to contract.
+
+    Returns:
+        numpy.ndarray:
+            `data` contracted along `axis`, with the remaining axes in order.
+    """
+    if data.flags.f_contiguous and not data.flags.c_contiguous:
+        return _contract(data.T, weights, data.ndim-1-axis).T
+    if axis == data.ndim-1:
+        return np.matmul(data, weights)
+    if axis == data.ndim-2:
+        return np.matmul(weights, data)
+    # outermost axis of a higher-dimensional array: the data fold into a
+    # matrix view, with `axis` as its rows.
+    return np.tensordot(weights, data, axes=([0], [axis]))
+
+
 class Spectra(ABC):
     """Abstract base class for spectra objects.
     """
@@ -24,23 +82,40 @@ class Spectra(ABC):
                 name (str): (Immutable) Name of this property.
                 size (int): (Immutable) Length (number of entries) in this
                     dimension.
-                scale (tuple): (Immutable) Scale along this dimension. This
-                    will generally be a tuple of floats.
+                scale (numpy.ndarray): (Immutable) Scale along this dimension.
+                    This is a read-only array of floats.
 
             Args:
                 axis (int): The axis index. Whether 0- or 1-indexed will depend
                     on the source data.
                 name (str): Name for this dimension/axis.
-                scale (array-like): Values/labels of this dimension. For
-                    example, the binding energies at each step.
+                scale (array-like): Numeric values of this dimension, e.g.
+                    the binding energies at each step, converted to a
+                    read-only float64 array. Raises TypeError if None, and
+                    ValueError if not numeric or not one-dimensional.
             """
             super().__init__()
             self.__axis = int(axis)
             self.__name = str(name)
-            self.__scale = tuple(scale)
+            if scale is None:
+                raise TypeError(f"Dimension {axis} ({name}) requires a scale.")
+            # store the scale as a read-only array, so it can be handed out
+            # without a copy.
+            self.__scale = np.array(scale, dtype=np.float64)
+            if self.__scale.ndim != 1:
+                raise ValueError(f"The scale of dimension {axis} ({name}) "
+                                 "must be one-dimensional.")
+            self.__scale.setflags(write=False)
+            # Dimension is immutable, so its hash only needs computing once.
+            self.__hash = hash((self.__axis, self.__name,
+                                self.__scale.tobytes()))
 
         def __hash__(self):
-            return hash(self.axis) + hash(self.name) + hash(self.scale)
+            return self.__hash
+
+        def __reduce__(self):
+            # rebuild through __init__, which restores the read-only scale.
+            return (type(self), (self.axis, self.name, self.scale))
 
         def __str__(self):
             return f"Dimension {self.axis} ({self.name}): {self.scale}"
@@ -84,13 +159,23 @@ class Spectra(ABC):
         self.attributes = dict()
         self.dim = dict()
         self.data = np.array([])
+        # each dimension once; `dim` holds each under several keys.
+        self._dims = set()
+
+    @property
+    def ndim(self):
+        """int: Number of dimensions set for this spectra.
+
+        Each dimension is reachable through several keys in `dim`, so this,
+        rather than `len(dim)`, counts the dimensions.
+        """
+        return len(self._dims)
 
     def get_dim(self, key):
         """Get the dimension corresponding to `key`.
 
         Args:
-            key (int, str, tuple, or Spectra.Dimension): Key identifying the
-                axis.
+            key (int, str, or Spectra.Dimension): Key identifying the axis.
 
         Returns:
             Spectra.Dimension:
@@ -106,42 +191,40 @@ class Spectra(ABC):
         Args:
             axis (int or Spectra.Dimension): The axis that is to be added.
             name (str): (optional) The name of the dimension to be added.
-            scale (tuple): (optional) The scale/labels of the axis.
+            scale (array-like): (optional) The numeric scale of the axis.
+                Required unless `axis` is a Spectra.Dimension.
 
         Returns:
             None.
         """
         if isinstance(axis, Spectra.Dimension):
             dim = axis
-            axis, name, scale = axis.axis, axis.name, axis.scale
+            axis, name = axis.axis, axis.name
         else:
             dim = Spectra.Dimension(axis=axis, name=name, scale=scale)
         self.rm_dim(axis)
+        # the scale is not used as a key: hashing a long scale is expensive
+        # and nothing looks dimensions up by their scale.
         self.dim[dim] = dim
         self.dim[name] = dim
         self.dim[axis] = dim
-        self.dim[scale] = dim
+        self._dims.add(dim)
 
     def rm_dim(self, key):
         """Remove all references to the dimension identified by `key`.
 
         Args:
-            key (int, str, tuple, or Spectra.Dimension): The axis to be removed.
+            key (int, str, or Spectra.Dimension): The axis to be removed.
 
         Returns:
             None.
         """
         dim = self.get_dim(key)
         if dim:
-            axis, name, scale = dim.axis, dim.name, dim.scale
-            if dim in self.dim:
-                del self.dim[dim]
-            if axis in self.dim:
-                del self.dim[axis]
-            if name in self.dim:
-                del self.dim[name]
-            if scale in self.dim:
-                del self.dim[scale]
+            self.dim.pop(dim, None)
+            self.dim.pop(dim.axis, None)
+            self.dim.pop(dim.name, None)
+            self._dims.discard(dim)
 
     @abstractmethod
     def axis(self, key):
@@ -189,10 +272,11 @@ class Spectra(ABC):
 
         Returns:
             numpy.ndarray:
-                Scale of the requested axis, or None if not found.
+                Scale of the requested axis, or None if not found. The array
+                is read-only; use `copy` to obtain a modifiable scale.
         """
         try:
-            return np.array(self.dim[key].scale)
+            return self.dim[key].scale
         except KeyError:
             return None
 
@@ -228,14 +312,23 @@ class Spectra(ABC):
             return self
         # return value
         rval = type(self)(self.name)
-        rval.attributes = deepcopy(self.attributes)
+        rval.attributes = _copy_attributes(self.attributes)
         # calculate the integrated spectra
         axis, scale = self.axis(key), self.scale(key)
-        rval.data = np.trapz(self.data, x=scale, axis=axis)
-        rval.data /= np.sum(scale[1:] - scale[:-1])
+        # trapezoidal rule expressed as a weighted sum along `axis`, which is
+        # then normalized by the range of the scale.
+        dx = np.diff(scale)
+        weights = np.zeros(len(scale), dtype=np.float64)
+        weights[:-1] += dx
+        weights[1:] += dx
+        weights *= 0.5/(scale[-1] - scale[0])
+        # match the precision of the data, so that e.g. float32 data are not
+        # upcast (copied) to float64 for the contraction.
+        dtype = np.result_type(self.data.dtype, np.float32)
+        rval.data = _contract(self.data, weights.astype(dtype), axis)
         # populate the dimension information.
         rmdim = self.get_dim(key)
-        for dim in set(self.dim.values()):
+        for dim in self._dims:
             # drop the dimension that was reduced
             if dim is rmdim:
                 continue
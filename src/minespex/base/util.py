@@ -18,11 +18,15 @@ def as_basic_type(x):
             fail, then `x` is returned unchanged.
     """
     if isinstance(x, str):
-        try:
-            return int(x)
-        except ValueError:
+        # int() can never parse a decimal point or an exponent, so skip the
+        # failed attempt (and its exception) for float-like strings.
+        if '.' not in x and 'e' not in x and 'E' not in x:
             try:
-                return float(x)
+                return int(x)
             except ValueError:
                 pass
+        try:
+            return float(x)
+        except ValueError:
+            pass
     return x
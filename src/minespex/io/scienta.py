@@ -3,21 +3,68 @@
 
 from ..base.spectra import Scienta
 from ..base.util import as_basic_type
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from functools import partial
 from io import StringIO
+import locale
+import mmap
+import os
 import re
+import sys
 import numpy as np
 
 import logging
-_logger = logging.getLogger()
+_logger = logging.getLogger(__name__)
 
 
-# debugging
-import sys
+# parsers for the "Dimension (#) [key]" entries of a Region block.
+_DIM_PARSERS = {
+    "name": str,
+    "size": int,
+    "scale": lambda s: tuple(float(x) for x in s.split())
+}
+
+
+# block header, e.g. "[Region 1]" or "[Data 1:2]"
+_BLOCK_HEADER_RE = re.compile(r'^\[([^0-9:]+)(?:\s+([0-9:]+))*\]')
+
+# start of the line that opens a [Region] block.
+_REGION_START_RE = re.compile(r'^[ \t]*\[Region\b', re.MULTILINE)
+
+
+def _parse_attributes(block):
+    """Parses the key=value contents of a block.
+
+    Args:
+        block (Reader.BlockIter.Block): Block whose contents are key=value
+            pairs, one per line.
+
+    Returns:
+        dict:
+            Values, converted to basic types where possible, keyed by name.
+    """
+    contents = dict()
+    for line in block.contents:
+        key, sep, value = line.partition('=')
+        # the same keys recur in every region; intern them so all regions
+        # share one copy of each key.
+        contents[sys.intern(key)] = as_basic_type(value)
+    return contents
+
+
+def _noop(block):
+    """Handler for blocks that carry no information to be stored."""
+    return None
 
 
 class Reader:
     VERSIONS = ("1.3.1",)
+    # type in which spectral data are stored. Single precision is ample for
+    # detector counts and halves the memory of each region; set to
+    # np.float64 to read data in double precision.
+    DTYPE = np.float32
 
     class BlockIter:
         class Block:
@@ -61,12 +108,16 @@ class Reader:
                     # block in "scienta_file.txt".
 
             Args:
-                fobj (file-like object): File stream from which the blocks to
-                    be read.
+                fobj (file-like object or iterable of str): File stream, or
+                lines, from which the blocks are to be read.
             """
-            # stream object from which the spectra are to be read.
-            self.__fobj = fobj
-            self._start = [0]
+            # lines from which the spectra are to be read.
+            self.__fobj = iter(fobj)
+            # header that terminated the last block read; it opens the next.
+            self._header = None
+            # last block read, and whether it should be returned again.
+            self._last = None
+            self._rewind = False
 
         def __iter__(self):
             return self
@@ -81,36 +132,39 @@ class Reader:
                 Reader.BlockIter.Block:
                     The block read from the iterator's file object.
             """
-            inblock = False
+            if self._rewind:
+                # reread the last block without touching the stream.
+                self._rewind = False
+                if self._last is None:
+                    raise StopIteration()
+                return self._last
             block = None
-            regex = re.compile(r'^\[([^0-9:]+)(?:\s+([0-9:]+))*\]')
-            # rewind the stream to the beginning of the next block
-            self.__fobj.seek(self._start[-1])
-            # read the next block
-            self._start.append(self._start[-1])
+            # the header of this block was read as the end of the last block.
+            header, self._header = self._header, None
+            if header is not None:
+                block = self._start_block(header)
             for line in self.__fobj:
-                # check for a header
-                match = re.match(regex, line.strip())
-                if match:
-                    if not inblock:
-                        inblock = True
-                        # process header
-                        block = Reader.BlockIter.Block()
-                        block.name, block.index = match.groups()
-                        _logger.info("Read block {name}, index {index}".format(
-                            name=block.name, index=block.index))
-                    else:
-                        break
+                stripped = line.strip()
+                if not stripped:
+                    # skip empty lines.
+                    continue
+                if stripped[0] != '[':
+                    # only lines opening with "[" can be a header; everything
+                    # else, e.g. every row of data, is block contents.
+                    block.contents.append(stripped)
+                    continue
+                match = _BLOCK_HEADER_RE.match(stripped)
+                if match is None:
+                    block.contents.append(stripped)
+                elif block is None:
+                    block = self._start_block(match)
                 else:
-                    # add the line to the block contents (if not an empty line).
-                    content = line.strip()
-                    if content != '':
-                        block.contents.append(content)
-                # keep track of the length of lines have been read. tell does
-                # not work when reading a file line-by-line.
-                self._start[-1] += len(line)
+                    # hold on to the header that starts the next block.
+                    self._header = match
+                    break
             if block is None:
                 raise StopIteration()
+            self._last = block
             return block
 
         def prev(self):
@@ -118,14 +172,43 @@ class Reader:
 
             A subsequent call to "next" will reread the last block read.
             """
-            pos = self._start.pop()
+            self._rewind = True
+
+        @staticmethod
+        def _start_block(match):
+            """Creates an empty block from a matched block header."""
+            block = Reader.BlockIter.Block()
+            block.name, block.index = match.groups()
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("Read block {name}, index {index}".format(
+                    name=block.name, index=block.index))
+            return block
 
 
     class RegionIter:
-        def __init__(self, fobj):
+        def __init__(self, fobj, dtype=None):
+            """Iterates through the regions read from `fobj`.
+
+            Args:
+                fobj (file-like object or iterable of str): File stream, or
+                    lines, from which the regions are to be read.
+                dtype (numpy.dtype): (optional) Type in which the spectral
+                    data are stored. Default: `Reader.DTYPE`.
+            """
             self.__fobj = fobj
             self.blockiter = Reader.BlockIter(fobj)
             self.region = None
+            self.dtype = Reader.DTYPE if dtype is None else dtype
+            # whether the current region holds 3D data (set by its Region
+            # block).
+            self._is_3d = False
+            # block handlers, keyed by block name.
+            self._handlers = {
+                "Region": self.process_region_block,
+                "Info": self.process_info_block,
+                "Run Mode Information": self.process_run_mode_information_block,
+                "Data": self.process_data_block
+            }
 
         def __iter__(self):
             return self
@@ -142,22 +225,14 @@ class Reader:
                     level.
             """
             region = None
-            inregion = False
             for block in self.blockiter:
                 if block.name == "Region":
-                    if not inregion:
-                        inregion = True
-                        region = self.region = Scienta()
-                        self.process_region_block(block)
-                    else:
+                    if region is not None:
+                        # this block starts the next region.
                         self.blockiter.prev()
                         break
-                {
-                    "Region": self.process_region_block,
-                    "Info": self.process_info_block,
-                    "Run Mode Information": self.process_run_mode_information_block,
-                    "Data": self.process_data_block
-                }.get(block.name, lambda b: None)(block)
+                    region = self.region = Scienta()
+                self._handlers.get(block.name, _noop)(block)
             if region is None:
                 raise StopIteration()
             return region
@@ -181,19 +256,15 @@ class Reader:
             # iterate through the contents of the block.
             for line in block.contents:
                 key, sep, value = line.partition("=")
-                match = re.match(r'Dimension (\d+) (\w+)', key)
-                if match:
+                if key.startswith("Dimension "):
                     # look for block contents that start with
                     # Dimension (#) [dimension key]=[dimension value]
-                    i, k = match.groups()
-                    i = int(i)
-                    value = {
-                        "name": lambda s: str(s),
-                        "size": lambda s: int(s),
-                        "scale": lambda s: tuple(float(x) for x in s.split())
-                    }.get(k, as_basic_type)(value)
-                    kv[i] = {**kv.get(i, {'axis': i}), **{k: value}}
-                elif re.match(r'Region Name', key):
+                    parts = key.split(None, 2)
+                    if len(parts) == 3 and parts[1].isdigit():
+                        i, k = int(parts[1]), parts[2]
+                        value = _DIM_PARSERS.get(k, as_basic_type)(value)
+                        kv[i] = {**kv.get(i, {'axis': i}), **{k: value}}
+                elif key == "Region Name":
                     self.region.name = value
             for kwds in kv.values():
                 self.region.set_dim(axis=kwds["axis"],
@@ -201,7 +272,11 @@ class Reader:
                                     scale=kwds["scale"])
             # finally, create the arrays to store the data.
             shape = tuple(kv[i]["size"] for i in range(1, len(kv)+1))
-            self.region.data = np.ndarray(shape, dtype=float)
+            # 3D data arrive one [:, :, iz] slice per Data block; Fortran
+            # order makes each of those slices contiguous in memory.
+            self._is_3d = (len(shape) == 3)
+            order = 'F' if self._is_3d else 'C'
+            self.region.data = np.empty(shape, dtype=self.dtype, order=order)
 
         def process_info_block(self, block):
             """Extracts information from the Info block.
@@ -216,9 +291,7 @@ class Reader:
                 None.
             """
             assert block.name == "Info"
-            contents = {k:as_basic_type(v)
-                        for line in block.contents
-                        for k,s,v in [line.partition('=')]}
+            contents = _parse_attributes(block)
             if block.index is None:
                 # check the global Info block for version compatibility.
                 if contents["Version"] not in Reader.VERSIONS:
@@ -241,17 +314,15 @@ class Reader:
                 None.
             """
             assert block.name == "Run Mode Information"
-            contents = {k:as_basic_type(v)
-                        for line in block.contents
-                        for k,s,v in [line.partition('=')]}
+            contents = _parse_attributes(block)
             self.region.attributes["Run Mode Information"] = contents
 
         def process_data_block(self, block):
             """Extracts information from each data block.
 
-            This can be 2 or 3 dimensional. If 2D, then `Blocks.index` will be
-            a single integer. If 3D, then `Blocks.index` will be of the form
-            "#:#".
+            This can be 2 or 3 dimensional, as set by the preceding Region
+            block. If 2D, then `Blocks.index` will be a single integer. If 3D,
+            then `Blocks.index` will be of the form "#:#".
 
             Args:
                 block (Reader.BlockIter.Block): Block that contains
@@ -261,55 +332,167 @@ class Reader:
                 None.
             """
             assert block.name == "Data"
-            ixy, s, iz = block.index.partition(':')
-            data = np.array([[float(col) for col in row.split()[1:]]
-                             for row in block.contents])
-            if iz:
-                # data is 3D
-                iz = int(iz)-1
+            # parse the whole block with a single call into numpy's C parser,
+            # which also checks that every row has the same number of columns.
+            # The first column holds the dimension 1 scale, already read from
+            # the Region block.
+            data = np.loadtxt(StringIO("\n".join(block.contents)),
+                              dtype=self.dtype, ndmin=2)[:, 1:]
+            # a region with a single dimension still has one intensity
+            # column per row.
+            expected = self.region.data.shape[:2]
+            if len(expected) == 1:
+                expected += (1,)
+            if data.shape != expected:
+                raise ValueError(
+                    f"Data block {block.index} holds {data.shape} values, "
+                    f"but the Region block declares {expected}.")
+            if self._is_3d:
+                # data is 3D: the index is "#:#", the second being the slice.
+                iz = int(block.index.rpartition(':')[2])-1
                 self.region.data[:,:,iz] = data
             else:
-                # data is 2D
-                self.region.data = data
+                # data is 1D or 2D: fill the array reserved by the Region
+                # block.
+                self.region.data[...] = data.reshape(self.region.data.shape)
 
 
     @classmethod
-    def load(cls, fileobj):
+    def load(cls, fileobj, dtype=None):
         """Loads Scienta-formatted data.
 
         Args:
             fileobj (file-like): File-like object from which to read the XPS
-                data. Must support `seek` and iteration.
+                data. Must support `read`.
+            dtype (numpy.dtype): (optional) Type in which the spectral data
+                are stored. Default: `Reader.DTYPE`.
 
         Returns:
             list(Scienta): Scienta spectra (regions) read.
         """
-        return list(Reader.RegionIter(fileobj))
+        return cls.loads(fileobj.read(), dtype=dtype)
 
     @classmethod
-    def loads(cls, string):
+    def loads(cls, string, dtype=None):
         """Loads Scienta-formatted data.
 
         Args:
             string (str): String from which to read Scienta-formatted data.
+            dtype (numpy.dtype): (optional) Type in which the spectral data
+                are stored. Default: `Reader.DTYPE`.
 
         Returns:
             list(Scienta):
                 Scienta spectra (regions) read.
         """
-        with StringIO(string) as ifs:
-            return cls.load(ifs)
+        # split the whole string at once, rather than pulling lines one by one
+        # from a stream.
+        return list(Reader.RegionIter(string.splitlines(), dtype=dtype))
+
+
+def _split_regions(text):
+    """Splits Scienta-formatted text at the start of each region.
+
+    Regions are independent of one another, so each of the strings returned
+    can be loaded on its own. The first holds whatever precedes the first
+    region, e.g. the global [Info] block.
+
+    Args:
+        text (str): Scienta-formatted text.
+
+    Returns:
+        list(str):
+            Consecutive pieces of `text`, each starting with a [Region] block.
+    """
+    starts = [m.start() for m in _REGION_START_RE.finditer(text)]
+    bounds = [0] + starts + [len(text)]
+    return [text[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+# regions read by `read(..., cache=True)`, most recently used last, keyed by
+# (path, modification time, size, dtype).
+_cache = OrderedDict()
+_CACHE_SIZE = 8
+
+
+def _read(path, workers, dtype):
+    """Reads and parses a Scienta-formatted file.
+
+    Args:
+        path (str): Name of the file that is to be read.
+        workers (int): Number of processes used to parse the regions of the
+            file.
+        dtype (numpy.dtype): Type in which the spectral data are stored.
+            This is passed to the worker processes explicitly, since they
+            need not share the parent's `Reader.DTYPE`.
+
+    Returns:
+        list(Scienta):
+            Scienta spectra (regions) read from `path`.
+    """
+    with open(path, 'rb') as ifs:
+        if os.fstat(ifs.fileno()).st_size == 0:
+            # an empty file cannot be mapped, and holds no regions.
+            return []
+        # map the file and decode it in a single pass, rather than decoding
+        # and buffering it chunk by chunk through a text stream.
+        with mmap.mmap(ifs.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, locale.getpreferredencoding(False))
+    if workers > 1:
+        chunks = _split_regions(text)
+        # the first chunk precedes the first region. Starting more processes
+        # than there are regions, or any for a single region, only adds cost.
+        nregions = len(chunks) - 1
+        if nregions > 1:
+            # parsing is pure python, so use processes to sidestep the GIL.
+            with ProcessPoolExecutor(
+                    max_workers=min(workers, nregions)) as executor:
+                chunks = executor.map(partial(Reader.loads, dtype=dtype),
+                                      chunks)
+                return [region for chunk in chunks for region in chunk]
+    return Reader.loads(text, dtype=dtype)
+
+
+def clear_cache():
+    """Discards the regions kept by `read(..., cache=True)`.
+
+    Returns:
+        None.
+    """
+    _cache.clear()
 
 
-def read(filename):
+def read(filename, workers=1, cache=False):
     """Reads a Scienta-formatted input file.
 
     Args:
         filename (str): Name of the file that is to be read.
+        workers (int): (optional) Number of processes used to parse the
+            regions of the file. Regions are parsed in parallel if greater
+            than 1. Default: 1.
+        cache (bool): (optional) Keep the regions read, so that reading the
+            file again, unchanged, only copies them. The regions of up to
+            8 files are kept, until released by `clear_cache`. A file is
+            considered unchanged if its modification time and size are; on
+            filesystems with coarse timestamps, call `clear_cache` after
+            rewriting a file. Default: False.
 
     Returns:
         list(Scienta):
             Scienta spectra (regions) read from the file.
     """
-    with open(filename, 'r') as ifs:
-        return Reader.load(ifs)
+    dtype = np.dtype(Reader.DTYPE)
+    if not cache:
+        return _read(filename, workers, dtype)
+    path = os.path.abspath(filename)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size, dtype)
+    regions = _cache.get(key)
+    if regions is None:
+        regions = _cache[key] = tuple(_read(path, workers, dtype))
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    # hand out copies, so callers are free to modify what they read.
+    return deepcopy(list(regions))
@@ -1,6 +1,10 @@
+import functools
+import multiprocessing
 import pytest
 import numpy as np
-from minespex.io.scienta import read
+from concurrent.futures import ProcessPoolExecutor
+from minespex.io import scienta
+from minespex.io.scienta import Reader, clear_cache, read
 
 def test_read_2d():
     # expected interface
@@ -70,3 +74,113 @@ def test_read_3d():
          [[10, 22],
           [11, 23],
           [12, 24]]])
+
+
+def test_block_rewind():
+    with open("data/scienta2D.txt") as ifs:
+        blockiter = Reader.BlockIter(ifs)
+        blockA = blockiter.next()
+        blockiter.prev()
+        blockB = blockiter.next()
+        assert blockA is blockB, "prev() did not rewind to the last block."
+        blockC = blockiter.next()
+        assert (blockC.name, blockC.index) == ("Region", "1")
+    with open("data/scienta2D.txt") as ifs:
+        names = [block.name for block in Reader.BlockIter(ifs)]
+    assert names == ["Info", "Region", "Info", "Run Mode Information", "Data",
+                     "Region", "Info", "Run Mode Information", "Data"]
+
+
+def test_read_dtype(monkeypatch):
+    s1, s2 = read("data/scienta2D.txt")
+    assert s1.data.dtype == Reader.DTYPE
+    monkeypatch.setattr(Reader, "DTYPE", np.float64)
+    s1, = read("data/scienta3D.txt")
+    assert s1.data.dtype == np.float64
+
+
+def test_read_parallel():
+    for filename in ("data/scienta2D.txt", "data/scienta3D.txt"):
+        serial = read(filename)
+        parallel = read(filename, workers=2)
+        assert len(serial) == len(parallel)
+        for s, p in zip(serial, parallel):
+            assert (s.name, s.attributes) == (p.name, p.attributes)
+            assert np.array_equal(s.data, p.data)
+            for i in range(1, s.data.ndim+1):
+                assert p.get_dim(i).name == s.get_dim(i).name
+                assert np.array_equal(p.scale(i), s.scale(i))
+                assert not p.scale(i).flags.writeable
+
+
+def test_read_cached(tmp_path):
+    filename = tmp_path / "scienta2D.txt"
+    with open("data/scienta2D.txt") as ifs:
+        text = ifs.read()
+    filename.write_text(text)
+    s1, s2 = read(str(filename), cache=True)
+    s1.data[...] = 0
+    s1.attributes["Region Name"] = "modified"
+    # rereading an unchanged file must not return the modified regions.
+    t1, t2 = read(str(filename), cache=True)
+    assert t1 is not s1
+    assert np.allclose(t1.data, [[1, 2], [3, 4]])
+    assert t1.attributes["Region Name"] == "foo"
+    assert not t1.scale(1).flags.writeable
+    # a changed file is read again.
+    filename.write_text(text.split("[Region 2]")[0])
+    assert len(read(str(filename), cache=True)) == 1
+    clear_cache()
+    # reads are not cached unless asked for.
+    read(str(filename))
+    assert not scienta._cache
+
+
+def test_read_malformed_data():
+    with open("data/scienta2D.txt") as ifs:
+        text = ifs.read()
+    # uneven rows, whose values nonetheless fill the declared shape.
+    uneven = text.replace(" 6.24e02 1.00e00 2.00e00",
+                          " 6.24e02 1.00e00", 1).replace(
+                          " 6.25e02 3.00e00 4.00e00",
+                          " 6.25e02 3.00e00 4.00e00 2.00e00", 1)
+    assert uneven != text
+    with pytest.raises(ValueError):
+        Reader.loads(uneven)
+    # an extra column in every row.
+    extra = text.replace(" 6.24e02 1.00e00 2.00e00",
+                         " 6.24e02 1.00e00 2.00e00 0.00e00", 1).replace(
+                         " 6.25e02 3.00e00 4.00e00",
+                         " 6.25e02 3.00e00 4.00e00 0.00e00", 1)
+    assert extra != text
+    with pytest.raises(ValueError):
+        Reader.loads(extra)
+
+
+def test_read_parallel_spawn(monkeypatch):
+    # spawned workers re-import the module, so they cannot rely on the
+    # parent's Reader.DTYPE.
+    monkeypatch.setattr(Reader, "DTYPE", np.float64)
+    monkeypatch.setattr(scienta, "ProcessPoolExecutor", functools.partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")))
+    serial = read("data/scienta2D.txt")
+    parallel = read("data/scienta2D.txt", workers=2)
+    assert len(serial) == len(parallel) == 2
+    for s, p in zip(serial, parallel):
+        assert p.data.dtype == np.float64
+        assert np.array_equal(s.data, p.data)
+
+
+def test_read_1d():
+    with open("data/scienta2D.txt") as ifs:
+        text = ifs.read().split("[Region 2]")[0]
+    # keep only the first dimension, and the first intensity column.
+    text = "\n".join(line for line in text.splitlines()
+                     if not line.startswith("Dimension 2"))
+    text = text.replace(" 6.24e02 1.00e00 2.00e00", " 6.24e02 1.00e00")
+    text = text.replace(" 6.25e02 3.00e00 4.00e00", " 6.25e02 3.00e00")
+    s1, = Reader.loads(text)
+    assert s1.ndim == 1
+    assert s1.data.shape == (2,)
+    assert np.allclose(s1.data, [1, 3])
+    assert np.allclose(s1.scale("Binding Energy [eV]"), (624, 625))
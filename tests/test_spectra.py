@@ -21,6 +21,7 @@ def test_Scienta():
     sint = s1.integrate_along("Y-Scale [mm]")
     uniqueDim = set(sint.dim.values())
     assert len(uniqueDim) == 1
+    assert sint.ndim == 1
     assert sint.axis("Binding Energy [eV]") == 0
     assert np.allclose(sint.scale("Binding Energy [eV]"), (624, 625))
     assert np.allclose(sint.data, [1.5, 3.5])
@@ -29,6 +30,7 @@ def test_Scienta():
     sint = s1.integrate_along("Y-Scale [mm]")
     uniqueDim = set(sint.dim.values())
     assert len(uniqueDim) == 2
+    assert sint.ndim == 2
     assert sint.axis("Binding Energy [eV]") == 0
     assert sint.axis("Seq. Iteration[a.u.]") == 1
     assert np.allclose(sint.scale("Binding Energy [eV]"), [624, 625, 626, 627])
@@ -42,6 +44,7 @@ def test_Scienta():
     sint = s1.integrate_along("Seq. Iteration[a.u.]")
     uniqueDim = set(sint.dim.values())
     assert len(uniqueDim) == 2
+    assert sint.ndim == 2
     assert sint.axis("Binding Energy [eV]") == 0
     assert sint.axis("Y-Scale [mm]") == 1
     assert np.allclose(sint.scale("Binding Energy [eV]"), [624, 625, 626, 627])
@@ -51,3 +54,50 @@ def test_Scienta():
          [10., 11., 12.],
          [13., 14., 15.],
          [16., 17., 18.]])
+
+
+def _integrated(data, scale, axis):
+    # reference trapezoidal integral, normalized by the range of the scale.
+    f = np.moveaxis(np.asarray(data, dtype=np.float64), axis, -1)
+    dx = np.diff(scale)
+    area = 0.5*np.sum((f[..., 1:] + f[..., :-1])*dx, axis=-1)
+    return area/(scale[-1] - scale[0])
+
+
+def _random_spectra(shape, order='C', dtype=np.float64):
+    rng = np.random.default_rng(0)
+    s = Scienta()
+    s.data = np.asarray(rng.random(shape), dtype=dtype, order=order)
+    for i, n in enumerate(shape):
+        s.set_dim(axis=i+1, name=f"dim {i+1}", scale=np.sort(rng.random(n)))
+    return s
+
+
+def test_integrate_along_fortran():
+    s = _random_spectra((4, 5, 6), order='F')
+    assert s.data.flags.f_contiguous
+    for i in range(1, 4):
+        sint = s.integrate_along(i)
+        assert sint.data.shape == tuple(n for j, n in enumerate((4, 5, 6))
+                                        if j != i-1)
+        assert np.allclose(sint.data, _integrated(s.data, s.scale(i), i-1))
+
+
+def test_integrate_along_float32():
+    s = _random_spectra((4, 5, 6), dtype=np.float32)
+    for i in range(1, 4):
+        sint = s.integrate_along(i)
+        assert sint.data.dtype == np.float32
+        assert np.allclose(sint.data, _integrated(s.data, s.scale(i), i-1),
+                           rtol=1e-5)
+
+
+def test_set_dim_scale():
+    s = Scienta()
+    with pytest.raises(TypeError):
+        s.set_dim(1, "a")
+    with pytest.raises(ValueError):
+        s.set_dim(1, "a", scale=1.0)
+    assert s.get_dim(1) is None
+    s.set_dim(1, "a", scale=[1, 2, 3])
+    assert s.size(1) == 3